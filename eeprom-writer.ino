@@ -68,9 +68,13 @@ static const int kPin_WaitingForInput  = 13;
 static const int kPin_LED_Red = 22;
 static const int kPin_LED_Grn = 53;
 
-byte g_cmd[80]; // strings received from the controller will go in here
+static const int kMaxCmdSize = 80;
+byte g_cmd[kMaxCmdSize]; // strings received from the controller will go in here
 static const int kMaxBufferSize = 16;
 byte buffer[kMaxBufferSize];
+// "aaaa:" + two hex chars per byte + ",cc\r\n" + "OK\r\n"
+static const int kMaxResponseSize = 5 + (kMaxBufferSize * 2) + 5 + 4;
+char g_response[kMaxResponseSize]; // replies to the controller are built up in here, then sent in one go
 
 static const long int k_uTime_WritePulse_uS = 1; 
 static const long int k_uTime_ReadPulse_uS = 1;
@@ -157,15 +161,18 @@ void ReadEEPROM() // R<address>  - read kMaxBufferSize bytes from EEPROM, beginn
       
   ReadEEPROMIntoBuffer(addr, kMaxBufferSize);
 
-  // now print the results, starting with the address as hex ...
-  Serial.print(hex[ (addr & 0xF000) >> 12 ]);
-  Serial.print(hex[ (addr & 0x0F00) >> 8  ]);
-  Serial.print(hex[ (addr & 0x00F0) >> 4  ]);
-  Serial.print(hex[ (addr & 0x000F)       ]);
-  Serial.print(":");
-  PrintBuffer(kMaxBufferSize);
+  // now build up the results, starting with the address as hex ...
+  int n = 0;
+  g_response[n++] = hex[ (addr & 0xF000) >> 12 ];
+  g_response[n++] = hex[ (addr & 0x0F00) >> 8  ];
+  g_response[n++] = hex[ (addr & 0x00F0) >> 4  ];
+  g_response[n++] = hex[ (addr & 0x000F)       ];
+  g_response[n++] = ':';
+  n = FormatBuffer(n, kMaxBufferSize);
+  n = AppendString(n, "OK\r\n");
 
-  Serial.println("OK");
+  // ... and hand the whole lot to the UART with a single call, rather than one call per character
+  Serial.write((const uint8_t *)g_response, n);
 
   digitalWrite(kPin_nOE, HIGH); // stops the EEPROM outputting the byte
 }
@@ -275,15 +282,7 @@ void SetSDPState(bool bWriteProtect)
   digitalWrite(kPin_nCE, LOW); // return to on by default for the rest of the code
   digitalWrite(kPin_LED_Red, LOW);
 
-  Serial.print("OK SDP ");
-  if (bWriteProtect)
-  {
-    Serial.println("enabled");
-  }
-  else
-  {
-    Serial.println("disabled");
-  }
+  Serial.println(bWriteProtect ? "OK SDP enabled" : "OK SDP disabled");
 }
 
 // ----------------------------------------------------------------------------------------
@@ -426,36 +425,56 @@ byte ReadData()
 
 // ----------------------------------------------------------------------------------------
 
-void PrintBuffer(int size)
+// formats the buffer as hex (plus checksum) into g_response, beginning at <pos>. Returns the new end of g_response.
+int FormatBuffer(int pos, int size)
 {
   uint8_t chk = 0;
 
   for (uint8_t x = 0; x < size; ++x)
   {
-    Serial.print(hex[ (buffer[x] & 0xF0) >> 4 ]);
-    Serial.print(hex[ (buffer[x] & 0x0F)      ]);
+    g_response[pos++] = hex[ (buffer[x] & 0xF0) >> 4 ];
+    g_response[pos++] = hex[ (buffer[x] & 0x0F)      ];
 
     chk = chk ^ buffer[x];
   }
 
-  Serial.print(",");
-  Serial.print(hex[ (chk & 0xF0) >> 4 ]);
-  Serial.print(hex[ (chk & 0x0F)      ]);
-  Serial.println("");
+  g_response[pos++] = ',';
+  g_response[pos++] = hex[ (chk & 0xF0) >> 4 ];
+  g_response[pos++] = hex[ (chk & 0x0F)      ];
+  return AppendString(pos, "\r\n");
 }
 
+// copies <s> into g_response, beginning at <pos>. Returns the new end of g_response.
+int AppendString(int pos, const char *s)
+{
+  while (*s && pos < kMaxResponseSize)
+  {
+    g_response[pos++] = *s++;
+  }
+
+  return(pos);
+}
+
+// reads one line from the controller into g_cmd. Anything beyond the size of g_cmd is discarded,
+// and anything after the newline is left in the serial buffer for the next call.
 void ReadString()
 {
   int i = 0;
-  byte c;
+  byte c = 0;
 
   g_cmd[0] = 0;
   do
   {
-    if (Serial.available())
+    // drain everything that has already arrived before polling again
+    while (Serial.available())
     {
       c = Serial.read();
-      if (c > 31)
+      if (c == 10)
+      {
+        break;
+      }
+
+      if (c > 31 && i < kMaxCmdSize - 1)
       {
         g_cmd[i++] = c;
         g_cmd[i] = 0;